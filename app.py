@@ -1,15 +1,21 @@
+from functools import lru_cache
 import numpy as np
 import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash import dcc, html, Patch
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
-from lissajous import lissajous_knot, plot_curves
+from lissajous import lissajous_knot, closed_curves, plot_curves
 
 
 app = dash.Dash(external_stylesheets=[dbc.themes.DARKLY])
 app.title = "Lissajous Knots"
 server = app.server
 
+# Layout and styling are built once; callbacks only patch the trace coordinates
+initial_key = (3, 4, 2, round(np.pi / 2, 6), round(np.pi / 2, 6), 100)
+initial_figure = plot_curves(*lissajous_knot(*initial_key))
+
 app.layout = dbc.Container(
     [
         dbc.Row(
@@ -58,26 +64,29 @@ app.layout = dbc.Container(
                                 ),
                                 html.P(""),
                                 html.P("ϕ1 [0 to 2π]"),
-                                dcc.Input(
+                                dcc.Slider(
                                     id="phi0",
                                     min=0, max=2 * np.pi, step=np.pi / 4,
-                                    type='range',
+                                    marks=None,
+                                    updatemode='mouseup',
                                     value=np.pi / 2,
                                 ),
                                 html.P(""),
                                 html.P("ϕ2 [0 to 2π]"),
-                                dcc.Input(
+                                dcc.Slider(
                                     id="phi1",
                                     min=0, max=2 * np.pi, step=np.pi / 4,
-                                    type='range',
+                                    marks=None,
+                                    updatemode='mouseup',
                                     value=np.pi / 2,
                                 ),
                                 html.P(""),
                                 html.P("Number of points"),
-                                dcc.Input(
+                                dcc.Slider(
                                     id="n_points",
                                     min=10, max=600, step=10,
-                                    type='range',
+                                    marks=None,
+                                    updatemode='mouseup',
                                     value=100,
                                 ),
 
@@ -97,7 +106,8 @@ app.layout = dbc.Container(
                 ),
                 dbc.Col(
                     [
-                            dcc.Graph(id="display", style={"height": "80vh"}),
+                            dcc.Graph(id="display", figure=initial_figure, style={"height": "80vh"}),
+                            dcc.Store(id="last_key", data=initial_key),
                     ],
                     width=True,
                 ),
@@ -118,22 +128,41 @@ app.layout = dbc.Container(
 
 
 @app.callback(
-    [Output(component_id='display', component_property='figure')],
+    [Output(component_id='display', component_property='figure'),
+     Output(component_id='last_key', component_property='data')],
     [Input(component_id='a', component_property='value'),
      Input(component_id='b', component_property='value'),
      Input(component_id='c', component_property='value'),
      Input(component_id='phi0', component_property='value'),
      Input(component_id='phi1', component_property='value'),
-     Input(component_id='n_points', component_property='value'),]
+     Input(component_id='n_points', component_property='value'),],
+    [State(component_id='last_key', component_property='data')],
+    prevent_initial_call=True,
 )
-def update_graph(a, b, c, phi1, phi2, n_points):
-    phi1 = float(phi1)
-    phi2 = float(phi2)
-    n_points = int(n_points)
-    x, y, z, x_offset, y_offset, z_offset = lissajous_knot(a, b, c, phi1, phi2, n_points)
-    fig = plot_curves(x, y, z, x_offset, y_offset, z_offset)
+def update_graph(a, b, c, phi1, phi2, n_points, last_key):
+    # Round the phases so that equivalent slider positions share a cache entry
+    phi1 = round(float(phi1), 6)
+    phi2 = round(float(phi2), 6)
+    # Keep the number of points within the slider range regardless of what the client sends
+    n_points = min(max(int(n_points), 10), 600)
+    # Skip the update if this session is already showing these parameters
+    key = [a, b, c, phi1, phi2, n_points]
+    if key == last_key:
+        raise PreventUpdate
+    curves = build_curves(a, b, c, phi1, phi2, n_points)
+    fig = Patch()
+    for n, (x, y, z) in enumerate(curves):
+        fig["data"][n]["x"] = x
+        fig["data"][n]["y"] = y
+        fig["data"][n]["z"] = z
+
+    return [fig, key]
 
-    return [fig]
+
+@lru_cache(maxsize=256)
+def build_curves(a, b, c, phi1, phi2, n_points):
+    x, y, z, x_offset, y_offset, z_offset = lissajous_knot(a, b, c, phi1, phi2, n_points)
+    return closed_curves(x, y, z, x_offset, y_offset, z_offset)
 
 
 if __name__ == "__main__":
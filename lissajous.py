@@ -1,7 +1,28 @@
+from functools import lru_cache
 import numpy as np
 import plotly.graph_objects as go
 
 
+@lru_cache(maxsize=64)
+def _get_t(n_points):
+    """
+    Return the cached, read-only sampling parameter array for the given number of points.
+    """
+    t = np.linspace(-np.pi, np.pi, n_points, dtype=np.float32)
+    t.flags.writeable = False
+    return t
+
+
+def _min_cos(k, values):
+    """
+    Return the minimum of cos(k * t + phi) over t in [-pi, pi], given its sampled values.
+    """
+    # For |k| >= 1 the argument spans at least a full period, so the minimum is known without a reduction
+    if abs(k) >= 1:
+        return -1.0
+    return np.min(values)
+
+
 def lissajous_knot(a, b, c, phi1, phi2, n_points, offset=1.5):
     """
     Calculate X, Y and Z cartesian coordinates for Lissajous knots according.
@@ -26,20 +47,76 @@ def lissajous_knot(a, b, c, phi1, phi2, n_points, offset=1.5):
 
     Returns
     -------
-    Arrays for XYZ coordinates of 3D curve and XYZ coordinates of 2D projections.
+    Single precision arrays for XYZ coordinates of 3D curve and XYZ coordinates of 2D projections.
+    The projection arrays are read-only broadcast views of a constant value.
     """
-    t = np.linspace(-np.pi, np.pi, n_points)
-    x = np.cos(a * t + phi1)
-    y = np.cos(b * t + phi2)
-    z = np.cos(c * t)
+    t = _get_t(n_points)
+    # Evaluate cos(k * t + phi) in place, in a single precision array shared by all three coordinates
+    xyz = np.empty((3, n_points), dtype=np.float32)
+    x, y, z = xyz
+    np.multiply(a, t, out=x)
+    x += phi1
+    np.cos(x, out=x)
+    np.multiply(b, t, out=y)
+    y += phi2
+    np.cos(y, out=y)
+    np.multiply(c, t, out=z)
+    np.cos(z, out=z)
 
-    x_offset = np.min(x) * np.ones(x.shape) * offset
-    y_offset = np.min(y) * np.ones(y.shape) * offset
-    z_offset = np.min(z) * np.ones(z.shape) * offset
+    # The projections lie on constant planes, so broadcast a scalar instead of allocating full arrays
+    x_offset = np.broadcast_to(np.float32(_min_cos(a, x) * offset), x.shape)
+    y_offset = np.broadcast_to(np.float32(_min_cos(b, y) * offset), y.shape)
+    z_offset = np.broadcast_to(np.float32(_min_cos(c, z) * offset), z.shape)
 
     return x, y, z, x_offset, y_offset, z_offset
 
 
+def _join_closed(*curves):
+    """
+    Close coordinate arrays of one or more curves and join them, separated by NaN so that each is drawn as its own line.
+    """
+    parts = []
+    for curve in curves:
+        if parts:
+            parts.append(np.full(1, np.nan, dtype=np.result_type(curve.dtype, np.float32)))
+        parts.append(curve)
+        parts.append(curve[:1])
+    return np.concatenate(parts)
+
+
+def closed_curves(x, y, z, x_offset, y_offset, z_offset):
+    """
+    Build the closed XYZ coordinates of the 3D curve and its 2D projections, in plotting order.
+    The three projections are joined into a single set of coordinates, separated by NaN.
+
+    Parameters
+    ----------
+    x : array
+        X axis cartesian coordinates of the 3D curve.
+    y : array
+        Y axis cartesian coordinates of the 3D curve.
+    z : array
+        Z axis cartesian coordinates of the 3D curve.
+    x_offset : array
+        X axis cartesian coordinates of the 2D projection.
+    y_offset : array
+        Y axis cartesian coordinates of the 2D projection.
+    z_offset : array
+        Z axis cartesian coordinates of the 2D projection.
+
+    Returns
+    -------
+    List of XYZ coordinate tuples for the 3D curve and the 2D projections.
+    """
+    curve = (_join_closed(x), _join_closed(y), _join_closed(z))
+    # Projections on the X, Y and Z planes, in that order
+    projections = (_join_closed(x_offset, x, x),
+                   _join_closed(y, y_offset, y),
+                   _join_closed(z, z, z_offset))
+
+    return [curve, projections]
+
+
 def plot_curves(x, y, z, x_offset, y_offset, z_offset, figsize=(850, 850)):
     """
     Plot 3D Lissajous Knot and its 2D projections.
@@ -66,67 +143,21 @@ def plot_curves(x, y, z, x_offset, y_offset, z_offset, figsize=(850, 850)):
     Plotly Figure object.
     """
     fig = go.Figure()
-    n_points = len(x)
-    for n in range(n_points):
-        showlegend = True if n == 0 else False
-        name = "3D"
-        fig.add_trace(go.Scatter3d(
-            x=[x[n], x[n + 1]] if n < n_points - 1 else [x[n], x[0]],
-            y=[y[n], y[n + 1]] if n < n_points - 1 else [y[n], y[0]],
-            z=[z[n], z[n + 1]] if n < n_points - 1 else [z[n], z[0]],
-            mode="lines",
-            line=dict(
-                color='darkgoldenrod',
-                width=6,
-            ),
-            name=name,
-            legendgroup=name,
-            showlegend=showlegend,
-        ))
-
-        name = "X Offset"
-        fig.add_trace(go.Scatter3d(
-            x=[x_offset[n], x_offset[n + 1]] if n < n_points - 1 else [x_offset[n], x_offset[0]],
-            y=[y[n], y[n + 1]] if n < n_points - 1 else [y[n], y[0]],
-            z=[z[n], z[n + 1]] if n < n_points - 1 else [z[n], z[0]],
-            mode="lines",
-            line=dict(
-                color='mediumspringgreen',
-                width=3,
-            ),
-            name=name,
-            legendgroup=name,
-            showlegend=showlegend,
-        ))
-
-        name = "Y Offset"
-        fig.add_trace(go.Scatter3d(
-            x=[x[n], x[n + 1]] if n < n_points - 1 else [x[n], x[0]],
-            y=[y_offset[n], y_offset[n + 1]] if n < n_points - 1 else [y_offset[n], y_offset[0]],
-            z=[z[n], z[n + 1]] if n < n_points - 1 else [z[n], z[0]],
-            mode="lines",
-            line=dict(
-                color='mediumspringgreen',
-                width=3,
-            ),
-            name=name,
-            legendgroup=name,
-            showlegend=showlegend,
-        ))
-
-        name = "Z Offset"
+    styles = [("3D", 'darkgoldenrod', 6),
+              ("Projections", 'mediumspringgreen', 3)]
+    curves = closed_curves(x, y, z, x_offset, y_offset, z_offset)
+    for (xc, yc, zc), (name, color, width) in zip(curves, styles):
         fig.add_trace(go.Scatter3d(
-            x=[x[n], x[n + 1]] if n < n_points - 1 else [x[n], x[0]],
-            y=[y[n], y[n + 1]] if n < n_points - 1 else [y[n], y[0]],
-            z=[z_offset[n], z_offset[n + 1]] if n < n_points - 1 else [z_offset[n], z_offset[0]],
+            x=xc,
+            y=yc,
+            z=zc,
             mode="lines",
             line=dict(
-                color='mediumspringgreen',
-                width=3,
+                color=color,
+                width=width,
             ),
             name=name,
-            legendgroup=name,
-            showlegend=showlegend,
+            showlegend=True,
         ))
 
     fig.update_layout(